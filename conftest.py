@@ -0,0 +1 @@
+"""Pytest configuration; keeps the repository root importable for the test suite."""
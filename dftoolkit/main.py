@@ -9,12 +9,22 @@ from typing import List
 
 from .hashing import HashCalculator
 from .metadata import FileMetadataExtractor
-from .memory import MemoryDumpAnalyzer
+from .memory import PAGE_SIZE, MemoryDumpAnalyzer
 from .recovery import DeletedFileRecoverySimulator
 from .timeline import TimelineAnalyzer
 from .registry import WindowsRegistryParser
 
 
+def _positive_int(value: str) -> int:
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"must be a positive integer: {value}")
+    return number
+
+
 class ToolkitCLI:
     """A simple multi-tool style CLI exposing the toolkit capabilities."""
 
@@ -51,6 +61,12 @@ class ToolkitCLI:
         memory_parser.add_argument("path")
         memory_parser.add_argument("--limit", type=int)
 
+        regions_parser = subparsers.add_parser("regions", help="Map entropy-classified regions of a memory dump")
+        regions_parser.add_argument("path")
+        regions_parser.add_argument("--page-size", type=_positive_int, default=PAGE_SIZE)
+        regions_parser.add_argument("--workers", type=_positive_int)
+        regions_parser.add_argument("--json", action="store_true")
+
     def run(self, argv: List[str] | None = None) -> int:
         args = self.parser.parse_args(argv)
         if not args.command:
@@ -106,6 +122,19 @@ class ToolkitCLI:
                 print(f"0x{string.offset:08x}: {string.value}")
             return 0
 
+        if args.command == "regions":
+            analyzer = MemoryDumpAnalyzer()
+            regions = analyzer.region_map(args.path, page_size=args.page_size, workers=args.workers)
+            if args.json:
+                print(json.dumps([region.as_dict() for region in regions], indent=2))
+                return 0
+            for region in regions:
+                print(
+                    f"0x{region.start:08x}-0x{region.end:08x} {region.classification:<12} "
+                    f"pages={region.page_count} entropy={region.mean_entropy:.2f}"
+                )
+            return 0
+
         self.parser.error(f"Unknown command: {args.command}")
         return 2
 
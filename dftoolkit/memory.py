@@ -2,14 +2,36 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, asdict
+from itertools import islice, repeat
 from pathlib import Path
-from typing import Iterable, List
+from typing import Dict, Iterable, Iterator, List, Tuple
+import math
+import mmap
+import os
 import re
 
+try:  # NumPy is optional; the profiler falls back to the standard library.
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on the environment
+    np = None
+
 
 ASCII_RE = re.compile(rb"[ -~]{4,}")
 
+PAGE_SIZE = 4096
+BLOCK_SIZE = 4 * 1024 * 1024
+MAX_PAGES_PER_BLOCK = 1024
+PRINTABLE_BYTES = bytes(range(0x20, 0x7F)) + b"\t\n\r"
+
+ZERO_THRESHOLD = 0.99
+HIGH_ENTROPY_THRESHOLD = 7.5
+TEXT_THRESHOLD = 0.85
+
+PageStats = Tuple[int, float, float, float]
+
 
 @dataclass
 class MemoryString:
@@ -17,6 +39,110 @@ class MemoryString:
     value: str
 
 
+@dataclass
+class PageProfile:
+    """Entropy and byte composition of a single page of a dump."""
+
+    offset: int
+    size: int
+    entropy: float
+    zero_ratio: float
+    printable_ratio: float
+    classification: str
+
+
+@dataclass
+class MemoryRegion:
+    """A run of adjacent pages sharing the same classification."""
+
+    start: int
+    end: int
+    classification: str
+    page_count: int
+    mean_entropy: float
+
+    @property
+    def size(self) -> int:
+        return self.end - self.start
+
+    def as_dict(self) -> Dict[str, object]:
+        data = asdict(self)
+        data["mean_entropy"] = round(self.mean_entropy, 3)
+        return data
+
+
+def classify_page(entropy: float, zero_ratio: float, printable_ratio: float) -> str:
+    """Return the region class for a page with the given statistics."""
+
+    if zero_ratio >= ZERO_THRESHOLD:
+        return "zero"
+    if entropy >= HIGH_ENTROPY_THRESHOLD:
+        return "high_entropy"
+    if printable_ratio >= TEXT_THRESHOLD:
+        return "text"
+    return "data"
+
+
+def _stats_from_counts(counts: List[int], size: int) -> PageStats:
+    entropy = 0.0
+    for count in counts:
+        if count:
+            p = count / size
+            entropy -= p * math.log2(p)
+    printable = sum(counts[byte] for byte in PRINTABLE_BYTES)
+    return size, entropy, counts[0] / size, printable / size
+
+
+def _profile_pages_stdlib(data: bytes, page_size: int) -> List[PageStats]:
+    stats: List[PageStats] = []
+    for start in range(0, len(data), page_size):
+        page = data[start:start + page_size]
+        histogram = Counter(page)
+        counts = [histogram.get(byte, 0) for byte in range(256)]
+        stats.append(_stats_from_counts(counts, len(page)))
+    return stats
+
+
+def _profile_pages_numpy(data, page_size: int) -> List[PageStats]:
+    full_pages = len(data) // page_size
+    stats: List[PageStats] = []
+    if full_pages:
+        pages = data[: full_pages * page_size].reshape(full_pages, page_size)
+        # Offset every byte by 256 * row so a single bincount yields one histogram per page.
+        index = (np.arange(full_pages, dtype=np.uint32)[:, None] << 8) | pages
+        counts = np.bincount(index.ravel(), minlength=full_pages * 256).reshape(full_pages, 256)
+        probabilities = counts / page_size
+        with np.errstate(divide="ignore", invalid="ignore"):
+            terms = np.where(counts > 0, probabilities * np.log2(probabilities), 0.0)
+        # Adding 0.0 turns the -0.0 of single-valued pages into 0.0, matching the stdlib path.
+        entropy = -terms.sum(axis=1) + 0.0
+        zero_ratio = probabilities[:, 0]
+        printable_ratio = probabilities[:, np.frombuffer(PRINTABLE_BYTES, dtype=np.uint8)].sum(axis=1)
+        stats.extend(
+            (page_size, float(e), float(z), float(p))
+            for e, z, p in zip(entropy, zero_ratio, printable_ratio)
+        )
+    tail = data[full_pages * page_size:]
+    if len(tail):
+        counts = np.bincount(tail, minlength=256).tolist()
+        stats.append(_stats_from_counts(counts, len(tail)))
+    return stats
+
+
+def _profile_block(path: str, offset: int, length: int, page_size: int, use_numpy: bool) -> List[PageStats]:
+    """Profile ``length`` bytes at ``offset`` of *path*; runs inside worker processes."""
+
+    # mmap offsets must be aligned to the allocation granularity, so map a slightly larger window.
+    delta = offset % mmap.ALLOCATIONGRANULARITY
+    with open(path, "rb") as fh:
+        with mmap.mmap(fh.fileno(), length + delta, offset=offset - delta, access=mmap.ACCESS_READ) as mapped:
+            # Copy the block out so no buffer export outlives the mapping, even on error.
+            data = mapped[delta:delta + length]
+    if use_numpy:
+        return _profile_pages_numpy(np.frombuffer(data, dtype=np.uint8), page_size)
+    return _profile_pages_stdlib(data, page_size)
+
+
 class MemoryDumpAnalyzer:
     """Provide lightweight analysis features for raw memory dumps."""
 
@@ -58,12 +184,127 @@ class MemoryDumpAnalyzer:
             start = idx + 1
         return offsets
 
-    def summary(self, dump_path: str | Path) -> dict:
-        """Provide a quick overview of the dump file."""
+    def iter_page_profiles(
+        self,
+        dump_path: str | Path,
+        page_size: int = PAGE_SIZE,
+        block_size: int = BLOCK_SIZE,
+        workers: int | None = None,
+        use_numpy: bool | None = None,
+    ) -> Iterator[PageProfile]:
+        """Yield a :class:`PageProfile` for every page of the dump, in offset order.
+
+        The dump is memory-mapped and split into blocks of at most *block_size*
+        bytes and ``MAX_PAGES_PER_BLOCK`` pages, which are profiled in parallel
+        across *workers* processes. Byte histograms are computed with NumPy when
+        it is available.
+        """
+
+        path = Path(dump_path)
+        if not path.exists():
+            raise FileNotFoundError(f"Memory dump not found: {dump_path}")
+        if page_size <= 0:
+            raise ValueError("page_size must be positive")
+
+        if use_numpy is None:
+            use_numpy = np is not None
+        elif use_numpy and np is None:
+            raise RuntimeError("NumPy is not installed")
+
+        size = path.stat().st_size
+        if size == 0:
+            return
+        # Per-block histogram memory grows with the page count, so small pages get smaller blocks.
+        block_size = min(block_size, MAX_PAGES_PER_BLOCK * page_size)
+        block_size = max(page_size, block_size // page_size * page_size)
+        offsets = list(range(0, size, block_size))
+        lengths = [min(block_size, size - offset) for offset in offsets]
+        workers = min(workers or os.cpu_count() or 1, len(offsets))
+
+        tasks = zip(repeat(str(path)), offsets, lengths, repeat(page_size), repeat(use_numpy))
+        if workers <= 1:
+            for block_offset, task in zip(offsets, tasks):
+                yield from self._pages_from_block(block_offset, _profile_block(*task), page_size)
+            return
+
+        # Keep only a bounded number of blocks in flight so that closing the
+        # generator early does not leave the whole dump queued for profiling.
+        executor = ProcessPoolExecutor(max_workers=workers)
+        try:
+            pending = deque(executor.submit(_profile_block, *task) for task in islice(tasks, workers * 2))
+            for block_offset in offsets:
+                stats = pending.popleft().result()
+                pending.extend(executor.submit(_profile_block, *task) for task in islice(tasks, 1))
+                yield from self._pages_from_block(block_offset, stats, page_size)
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    @staticmethod
+    def _pages_from_block(block_offset: int, stats: List[PageStats], page_size: int) -> Iterator[PageProfile]:
+        for index, (size, entropy, zero_ratio, printable_ratio) in enumerate(stats):
+            yield PageProfile(
+                offset=block_offset + index * page_size,
+                size=size,
+                entropy=entropy,
+                zero_ratio=zero_ratio,
+                printable_ratio=printable_ratio,
+                classification=classify_page(entropy, zero_ratio, printable_ratio),
+            )
+
+    def region_map(self, dump_path: str | Path, **options) -> List[MemoryRegion]:
+        """Collapse the page profiles of the dump into classified regions.
+
+        Adjacent pages with the same classification are merged so the map stays
+        compact even for very large dumps, and ``mean_entropy`` is weighted by
+        page size. A short trailing page is classified on its own bytes; with
+        fewer than ``2 ** HIGH_ENTROPY_THRESHOLD`` (about 182) bytes it cannot be
+        reported as high entropy. *options* are forwarded to
+        :meth:`iter_page_profiles`.
+        """
+
+        regions: List[MemoryRegion] = []
+        current: MemoryRegion | None = None
+        entropy_total = 0.0
+        for page in self.iter_page_profiles(dump_path, **options):
+            if current is not None and current.classification == page.classification:
+                current.end = page.offset + page.size
+                current.page_count += 1
+                entropy_total += page.entropy * page.size
+                continue
+            if current is not None:
+                current.mean_entropy = entropy_total / current.size
+                regions.append(current)
+            current = MemoryRegion(
+                start=page.offset,
+                end=page.offset + page.size,
+                classification=page.classification,
+                page_count=1,
+                mean_entropy=page.entropy,
+            )
+            entropy_total = page.entropy * page.size
+        if current is not None:
+            current.mean_entropy = entropy_total / current.size
+            regions.append(current)
+        return regions
+
+    def summary(self, dump_path: str | Path, profile: bool = False) -> dict:
+        """Provide a quick overview of the dump file.
+
+        With *profile* enabled the overview also includes the region map and the
+        number of bytes falling into each classification.
+        """
 
         path = Path(dump_path)
         if not path.exists():
             raise FileNotFoundError(f"Memory dump not found: {dump_path}")
 
         size = path.stat().st_size
-        return {"path": str(path.resolve()), "size_bytes": size}
+        result: dict = {"path": str(path.resolve()), "size_bytes": size}
+        if profile:
+            regions = self.region_map(path)
+            totals: Dict[str, int] = {}
+            for region in regions:
+                totals[region.classification] = totals.get(region.classification, 0) + region.size
+            result["classification_bytes"] = totals
+            result["regions"] = [region.as_dict() for region in regions]
+        return result
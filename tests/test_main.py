@@ -0,0 +1,42 @@
+import json
+
+import pytest
+
+from dftoolkit.main import ToolkitCLI
+
+
+@pytest.fixture
+def dump_path(tmp_path):
+    path = tmp_path / "memory.dmp"
+    path.write_bytes(bytes(8192) + b"hello world\n" * 100)
+    return path
+
+
+def test_regions_prints_text_map(dump_path, capsys):
+    assert ToolkitCLI().run(["regions", str(dump_path), "--workers", "1"]) == 0
+
+    lines = capsys.readouterr().out.splitlines()
+    assert lines == [
+        "0x00000000-0x00002000 zero         pages=2 entropy=0.00",
+        "0x00002000-0x000024b0 text         pages=1 entropy=3.02",
+    ]
+
+
+def test_regions_prints_json_map(dump_path, capsys):
+    assert ToolkitCLI().run(["regions", str(dump_path), "--page-size", "8192", "--workers", "1", "--json"]) == 0
+
+    regions = json.loads(capsys.readouterr().out)
+    assert [(r["start"], r["end"], r["classification"], r["page_count"]) for r in regions] == [
+        (0, 8192, "zero", 1),
+        (8192, 9392, "text", 1),
+    ]
+
+
+@pytest.mark.parametrize("option", ["--page-size", "--workers"])
+@pytest.mark.parametrize("value", ["0", "-2", "abc"])
+def test_regions_rejects_non_positive_integers(dump_path, capsys, option, value):
+    with pytest.raises(SystemExit) as excinfo:
+        ToolkitCLI().run(["regions", str(dump_path), option, value])
+
+    assert excinfo.value.code == 2
+    assert f"argument {option}: must be a positive integer: {value}" in capsys.readouterr().err
@@ -0,0 +1,146 @@
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from dftoolkit import memory
+from dftoolkit.memory import PAGE_SIZE, MemoryDumpAnalyzer
+
+TAIL_SIZE = 1000
+
+
+@pytest.fixture
+def dump_path(tmp_path):
+    rng = random.Random(1234)
+    text = b"The quick brown fox jumps over the lazy dog.\n"
+    pages = [
+        bytes(PAGE_SIZE),
+        bytes(rng.getrandbits(8) for _ in range(PAGE_SIZE)),
+        (text * (PAGE_SIZE // len(text) + 1))[:PAGE_SIZE],
+        bytes(range(16)) * (PAGE_SIZE // 16),
+        (text * (TAIL_SIZE // len(text) + 1))[:TAIL_SIZE],
+    ]
+    path = tmp_path / "memory.dmp"
+    path.write_bytes(b"".join(pages))
+    return path
+
+
+def _stats(pages):
+    return [(p.offset, p.size, p.entropy, p.zero_ratio, p.printable_ratio, p.classification) for p in pages]
+
+
+def test_region_map_classifies_pages(dump_path):
+    regions = MemoryDumpAnalyzer().region_map(dump_path, workers=1)
+
+    assert [(r.start, r.end, r.classification, r.page_count) for r in regions] == [
+        (0, PAGE_SIZE, "zero", 1),
+        (PAGE_SIZE, 2 * PAGE_SIZE, "high_entropy", 1),
+        (2 * PAGE_SIZE, 3 * PAGE_SIZE, "text", 1),
+        (3 * PAGE_SIZE, 4 * PAGE_SIZE, "data", 1),
+        (4 * PAGE_SIZE, 4 * PAGE_SIZE + TAIL_SIZE, "text", 1),
+    ]
+    assert regions[0].mean_entropy == 0.0
+    assert regions[3].mean_entropy == pytest.approx(4.0)
+
+
+def test_numpy_and_stdlib_backends_agree(dump_path):
+    pytest.importorskip("numpy")
+    analyzer = MemoryDumpAnalyzer()
+
+    with_numpy = list(analyzer.iter_page_profiles(dump_path, workers=1, use_numpy=True))
+    without_numpy = list(analyzer.iter_page_profiles(dump_path, workers=1, use_numpy=False))
+
+    assert len(with_numpy) == len(without_numpy) == 5
+    for fast, slow in zip(with_numpy, without_numpy):
+        assert (fast.offset, fast.size, fast.classification) == (slow.offset, slow.size, slow.classification)
+        assert fast.entropy == pytest.approx(slow.entropy)
+        assert fast.zero_ratio == pytest.approx(slow.zero_ratio)
+        assert fast.printable_ratio == pytest.approx(slow.printable_ratio)
+    assert str(with_numpy[0].entropy) == "0.0"
+
+
+def test_summary_profile_reports_regions_and_totals(dump_path):
+    result = MemoryDumpAnalyzer().summary(dump_path, profile=True)
+
+    assert result["size_bytes"] == 4 * PAGE_SIZE + TAIL_SIZE
+    assert result["classification_bytes"] == {
+        "zero": PAGE_SIZE,
+        "high_entropy": PAGE_SIZE,
+        "text": PAGE_SIZE + TAIL_SIZE,
+        "data": PAGE_SIZE,
+    }
+    assert [region["classification"] for region in result["regions"]] == ["zero", "high_entropy", "text", "data", "text"]
+    assert result["regions"][0] == {
+        "start": 0,
+        "end": PAGE_SIZE,
+        "classification": "zero",
+        "page_count": 1,
+        "mean_entropy": 0.0,
+    }
+    assert "regions" not in MemoryDumpAnalyzer().summary(dump_path)
+
+
+def test_region_mean_entropy_is_weighted_by_page_size(tmp_path):
+    path = tmp_path / "memory.dmp"
+    path.write_bytes(bytes(range(16)) * (PAGE_SIZE // 16) + bytes(range(2)) * 8)
+
+    (region,) = MemoryDumpAnalyzer().region_map(path, workers=1)
+
+    assert (region.classification, region.page_count, region.size) == ("data", 2, PAGE_SIZE + 16)
+    assert region.mean_entropy == pytest.approx((4.0 * PAGE_SIZE + 1.0 * 16) / (PAGE_SIZE + 16))
+
+
+@pytest.mark.parametrize("block_size, workers", [(PAGE_SIZE, 1), (PAGE_SIZE, 2), (2 * PAGE_SIZE, 2)])
+def test_block_splitting_does_not_change_results(dump_path, block_size, workers):
+    analyzer = MemoryDumpAnalyzer()
+
+    expected = _stats(analyzer.iter_page_profiles(dump_path, workers=1))
+    actual = _stats(analyzer.iter_page_profiles(dump_path, block_size=block_size, workers=workers))
+
+    assert actual == expected
+
+
+def test_small_pages_cap_block_page_count(tmp_path, monkeypatch):
+    lengths = []
+    profile_block = memory._profile_block
+
+    def recording_profile_block(path, offset, length, page_size, use_numpy):
+        lengths.append(length)
+        return profile_block(path, offset, length, page_size, use_numpy)
+
+    monkeypatch.setattr(memory, "_profile_block", recording_profile_block)
+    path = tmp_path / "memory.dmp"
+    path.write_bytes(bytes(range(256)) * 16)
+
+    pages = list(MemoryDumpAnalyzer().iter_page_profiles(path, page_size=1, workers=1))
+
+    assert lengths == [memory.MAX_PAGES_PER_BLOCK] * 4
+    assert len(pages) == 4096
+    assert [page.offset for page in pages] == list(range(4096))
+    assert {page.entropy for page in pages} == {0.0}
+
+
+def test_closing_generator_early_stops_the_scan(tmp_path, monkeypatch):
+    submitted = []
+
+    class RecordingExecutor(ProcessPoolExecutor):
+        def submit(self, fn, *args, **kwargs):
+            submitted.append(args[1])
+            return super().submit(fn, *args, **kwargs)
+
+    monkeypatch.setattr(memory, "ProcessPoolExecutor", RecordingExecutor)
+    path = tmp_path / "large.dmp"
+    path.write_bytes(bytes(256 * PAGE_SIZE))
+
+    pages = MemoryDumpAnalyzer().iter_page_profiles(path, block_size=PAGE_SIZE, workers=2)
+    assert next(pages).offset == 0
+    pages.close()
+
+    assert 0 < len(submitted) < 256
+
+
+def test_empty_dump_has_no_regions(tmp_path):
+    path = tmp_path / "empty.dmp"
+    path.write_bytes(b"")
+
+    assert MemoryDumpAnalyzer().region_map(path) == []